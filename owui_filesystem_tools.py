@@ -5,12 +5,659 @@ version: 1.0.0
 description: Direct filesystem access for OpenWebUI agents, matching Claude Code's capabilities
 """
 
+import errno
+import fnmatch
+import functools
+import json
 import os
+import re
+import select
+import shlex
+import stat
 import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List
 import glob as glob_module
 
+# Optional fast regex engines for grep (Hyperscan preferred, then RE2)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional io_uring bindings for batched reads on Linux
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+# ========================================
+# PATH HELPERS
+# ========================================
+
+@functools.lru_cache(maxsize=4096)
+def _resolve(base_str: str, file_path: str) -> str:
+    """Resolve file_path against base_str and normalise it for this platform."""
+    # os.path.join keeps an absolute file_path as-is; relative ones go under base_str
+    return os.path.normpath(os.path.join(base_str, file_path))
+
+
+# ========================================
+# READ HELPERS
+# ========================================
+
+# Shared pool for concurrent file reads across tool calls
+_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+
+# Recently read file contents: path -> (st_mtime_ns, st_size, content)
+_CONTENT_CACHE_SIZE = 256
+_CONTENT_CACHE_MAX_FILE = 1024 * 1024
+_content_cache = OrderedDict()
+_content_cache_lock = threading.Lock()
+
+# Buffer size for writes, well above io.DEFAULT_BUFFER_SIZE (8 KiB)
+_WRITE_BUFFER_SIZE = 256 * 1024
+
+# Process umask, read once since os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _read_cached(path: str) -> str:
+    """Read a UTF-8 file, reusing cached content while its mtime and size match.
+
+    Raises IsADirectoryError for anything that is not a regular file.
+    """
+    info = os.stat(path)
+    if not stat.S_ISREG(info.st_mode):
+        raise IsADirectoryError(errno.EISDIR, "Not a regular file", path)
+    version = (info.st_mtime_ns, info.st_size)
+
+    with _content_cache_lock:
+        cached = _content_cache.get(path)
+        if cached is not None and cached[:2] == version:
+            _content_cache.move_to_end(path)
+            return cached[2]
+
+    # Unbuffered: FileIO.readall sizes a single read from fstat
+    with open(path, 'rb', buffering=0) as f:
+        content = f.read().decode('utf-8')
+
+    if info.st_size <= _CONTENT_CACHE_MAX_FILE:
+        with _content_cache_lock:
+            _content_cache[path] = version + (content,)
+            _content_cache.move_to_end(path)
+            if len(_content_cache) > _CONTENT_CACHE_SIZE:
+                _content_cache.popitem(last=False)
+
+    return content
+
+
+def _invalidate_cached(path: str):
+    """Drop cached content for a file this module just modified.
+
+    In-place writes can leave mtime and size unchanged within one timestamp tick.
+    """
+    with _content_cache_lock:
+        _content_cache.pop(path, None)
+
+
+def _write_atomic(path: str, data: bytes, sync: bool = False):
+    """Write data to a sibling temp file, then rename it over path.
+
+    Readers see either the old or the new content, never a partial write.
+    Symlinks are written through and an existing file keeps its mode.
+    """
+    # Replace the link target, not the link itself
+    path = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # mkstemp creates 0600; give new files what open() would have
+        mode = 0o644 & ~_UMASK
+
+    # A random name, so a write killed mid-way never blocks the next one
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        try:
+            os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if sync:
+                # macOS has no fdatasync
+                if hasattr(os, "fdatasync"):
+                    os.fdatasync(fd)
+                else:
+                    os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    finally:
+        _invalidate_cached(path)
+
+
+class _IoUringReader:
+    """Batch whole-file reads into a single io_uring submission."""
+
+    QUEUE_DEPTH = 256
+
+    def __init__(self):
+        self._ring = liburing.io_uring()
+        self._cqes = liburing.io_uring_cqes()
+        liburing.io_uring_queue_init(self.QUEUE_DEPTH, self._ring, 0)
+        self._lock = threading.Lock()
+
+    def read_files(self, paths: List[str]) -> list:
+        """Return the bytes of each path, or the OSError raised reading it."""
+        results = [None] * len(paths)
+        with self._lock:
+            for start in range(0, len(paths), self.QUEUE_DEPTH):
+                self._read_batch(paths, start, results)
+        return results
+
+    def _read_batch(self, paths: List[str], start: int, results: list):
+        fds = []
+        buffers = {}
+        try:
+            for i in range(start, min(start + self.QUEUE_DEPTH, len(paths))):
+                try:
+                    # O_NONBLOCK keeps a FIFO from blocking the open (and the ring lock)
+                    fd = os.open(paths[i], os.O_RDONLY | os.O_NONBLOCK)
+                except OSError as e:
+                    results[i] = e
+                    continue
+                fds.append(fd)
+                info = os.fstat(fd)
+                # Same rule as _read_cached: only regular files are read
+                if not stat.S_ISREG(info.st_mode):
+                    results[i] = IsADirectoryError(errno.EISDIR, "Not a regular file", paths[i])
+                    continue
+                size = info.st_size
+                if size == 0:
+                    results[i] = b""
+                    continue
+                buffers[i] = bytearray(size)
+                sqe = liburing.io_uring_get_sqe(self._ring)
+                liburing.io_uring_prep_read(sqe, fd, buffers[i], size, 0)
+                sqe.user_data = i
+
+            if not buffers:
+                return
+
+            liburing.io_uring_submit(self._ring)
+            for _ in range(len(buffers)):
+                liburing.io_uring_wait_cqe(self._ring, self._cqes)
+                cqe = self._cqes[0]
+                i, res = cqe.user_data, cqe.res
+                liburing.io_uring_cqe_seen(self._ring, cqe)
+                if res < 0:
+                    results[i] = OSError(-res, os.strerror(-res), paths[i])
+                else:
+                    results[i] = bytes(memoryview(buffers[i])[:res])
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+
+_uring_reader = None
+_uring_checked = False
+_uring_lock = threading.Lock()
+
+
+def _get_uring_reader() -> Optional[_IoUringReader]:
+    """Return the shared io_uring reader, or None where io_uring is unavailable."""
+    global _uring_reader, _uring_checked
+    with _uring_lock:
+        if not _uring_checked:
+            _uring_checked = True
+            version = re.match(r"(\d+)\.(\d+)", os.uname().release) if hasattr(os, "uname") else None
+            # IORING_OP_READ needs Linux 5.6+
+            if liburing is not None and version and tuple(map(int, version.groups())) >= (5, 6):
+                try:
+                    _uring_reader = _IoUringReader()
+                except Exception:
+                    _uring_reader = None
+        return _uring_reader
+
+
+# ========================================
+# SEARCH HELPERS
+# ========================================
+
+# Most matching lines grep reports before truncating its output
+_GREP_MAX_MATCHES = 1000
+
+# grep scans are CPU-bound, so one worker per core; the regex engines run in C.
+# Each worker maps one file at a time, which also bounds open files and mappings.
+_SCAN_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+
+
+def _entry_is_dir(entry: os.DirEntry) -> bool:
+    """DirEntry.is_dir() that treats unreadable links (e.g. loops) as non-dirs."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _scandir_recursive(path: bytes, max_depth: int):
+    """Yield every file DirEntry under path, at most max_depth levels deep.
+
+    Symlinked directories are followed, as pathlib does for non-"**" segments.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    # e.g. a symlink loop; skip the entry, not the directory
+                    continue
+                if is_dir:
+                    if max_depth > 1:
+                        yield from _scandir_recursive(entry.path, max_depth - 1)
+                elif is_file:
+                    yield entry
+    except OSError:
+        return
+
+
+def _scandir_tree(path: bytes, link_depth: int = 0):
+    """Yield every file DirEntry under path, walking with an explicit stack.
+
+    Like pathlib's "**", the walk does not recurse into symlinked directories;
+    link_depth > 0 still lists that many levels inside them, for the fixed
+    segments that follow "**".
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        is_linked_dir = entry.is_dir()
+                        is_file = not is_linked_dir and entry.is_file()
+                    except OSError:
+                        # e.g. a symlink loop; skip the entry, not the directory
+                        continue
+                    if is_linked_dir:
+                        if link_depth > 0:
+                            yield from _scandir_recursive(entry.path, link_depth)
+                    elif is_file:
+                        yield entry
+        except OSError:
+            continue
+
+
+def _walk_dirs(path: bytes):
+    """Yield path and every directory below it, without following symlinks."""
+    stack = [path]
+    while stack:
+        path = stack.pop()
+        yield path
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _select_segments(path: bytes, segments: tuple):
+    """Yield files under path matching segments, one path component at a time.
+
+    Mirrors pathlib: "**" stands for zero or more whole directories and does
+    not enter symlinked ones, other segments follow links, and a trailing
+    "**" selects only directories, so it yields no files.
+    """
+    segment, rest = segments[0], segments[1:]
+
+    if segment == "**":
+        if rest:
+            for directory in _walk_dirs(path):
+                yield from _select_segments(directory, rest)
+        return
+
+    if not _has_wildcard(segment):
+        child = os.path.join(path, os.fsencode(segment))
+        if not rest:
+            if os.path.isfile(child):
+                yield child
+        elif os.path.isdir(child):
+            yield from _select_segments(child, rest)
+        return
+
+    name_match = _segment_matcher(segment)
+    try:
+        with os.scandir(path) as it:
+            entries = [entry for entry in it if name_match(entry.name)]
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if not rest:
+                if entry.is_file():
+                    yield entry.path
+            elif entry.is_dir():
+                yield from _select_segments(entry.path, rest)
+        except OSError:
+            # e.g. a symlink loop; skip the entry, not the directory
+            continue
+
+
+_WILDCARD = re.compile(r"[*?\[]")
+
+
+def _has_wildcard(pattern: str) -> bool:
+    """Return True if pattern contains any glob wildcard characters."""
+    return _WILDCARD.search(pattern) is not None
+
+
+def _normalize_literal(path: str) -> str:
+    """Normalise a literal pattern part ("./People//" -> "People", "." -> "")."""
+    if not path:
+        return ""
+    path = os.path.normpath(path)
+    return "" if path == os.curdir else path
+
+
+def _split_glob(pattern: str):
+    """Split pattern into its literal leading directories and the wildcard rest."""
+    match = _WILDCARD.search(pattern)
+    if match is None:
+        return _normalize_literal(pattern), ""
+    cut = pattern.rfind("/", 0, match.start()) + 1
+    return _normalize_literal(pattern[:cut]), pattern[cut:]
+
+
+class _DecodedGlobRegex:
+    """Match a glob against bytes paths by decoding them first."""
+
+    def __init__(self, pattern: str):
+        self._regex = re.compile(fnmatch.translate(pattern))
+
+    def match(self, path: bytes, pos: int = 0):
+        return self._regex.match(os.fsdecode(path[pos:]))
+
+
+@functools.lru_cache(maxsize=64)
+def _glob_regex(pattern: str):
+    """Compile a glob pattern into a regex over bytes paths, cached per pattern."""
+    # "?" and "[...]" match characters; a bytes regex would match single bytes
+    if "?" in pattern or "[" in pattern:
+        return _DecodedGlobRegex(pattern)
+    return re.compile(os.fsencode(fnmatch.translate(pattern)))
+
+
+@functools.lru_cache(maxsize=64)
+def _segment_matcher(segment: str):
+    """Return a predicate for a single bytes path segment such as b"*.md".
+
+    "*<literal>" segments become a bytes.endswith check instead of a regex.
+    Cached, so a session repeating the same file_pattern builds it once.
+    """
+    if segment.startswith("*") and not _has_wildcard(segment[1:]):
+        suffix = os.fsencode(segment[1:])
+        return lambda name: name.endswith(suffix)
+    return _glob_regex(segment).match
+
+
+def _iter_files(root: str, pattern: str):
+    """Yield the paths of files under root whose relative path matches pattern.
+
+    The walk stays in bytes end to end, so paths are yielded as bytes.
+    """
+    literal_prefix, wild_suffix = _split_glob(pattern)
+    start = os.fsencode(os.path.join(root, literal_prefix))
+
+    if not wild_suffix:
+        if os.path.isfile(start):
+            yield start
+        return
+
+    start_len = len(os.path.join(start, b""))
+    sep = os.fsencode(os.sep)
+
+    if "**" not in wild_suffix:
+        # Without "**" a pattern can only match at a fixed depth
+        depth = wild_suffix.count("/") + 1
+        if depth == 1:
+            name_match = _segment_matcher(wild_suffix)
+            for entry in _scandir_recursive(start, 1):
+                if name_match(entry.name):
+                    yield entry.path
+            return
+        regex = _glob_regex(wild_suffix)
+        for entry in _scandir_recursive(start, depth):
+            if regex.match(entry.path, start_len):
+                yield entry.path
+        return
+
+    tail = wild_suffix[3:]
+    if wild_suffix.startswith("**/") and "**" not in tail:
+        # Only the last segments can differ, so match just those
+        tail_depth = tail.count("/") + 1
+        if tail_depth == 1:
+            name_match = _segment_matcher(tail)
+            for entry in _scandir_tree(start):
+                if name_match(entry.name):
+                    yield entry.path
+            return
+        regex = _glob_regex(tail)
+        for entry in _scandir_tree(start, tail_depth - 1):
+            cut = len(entry.path)
+            for _ in range(tail_depth):
+                cut = entry.path.rfind(sep, start_len - 1, cut)
+                if cut < 0:
+                    break
+            else:
+                if regex.match(entry.path, cut + 1):
+                    yield entry.path
+        return
+
+    # Several "**" can reach one file along different splits; report it once
+    segments = tuple(s for s in wild_suffix.split("/") if s not in ("", "."))
+    seen = set()
+    for path in _select_segments(start, segments):
+        if path not in seen:
+            seen.add(path)
+            yield path
+
+
+def _build_matcher(pattern: str, ignore_case: bool):
+    """Compile pattern into a callable yielding match offsets in a buffer."""
+    if hyperscan is not None:
+        flags = hyperscan.HS_FLAG_MULTILINE
+        if ignore_case:
+            flags |= hyperscan.HS_FLAG_CASELESS
+        db = hyperscan.Database()
+        db.compile(expressions=[pattern.encode('utf-8')], ids=[0], flags=[flags])
+        # Scratch space is not thread-safe, so each worker gets its own
+        local = threading.local()
+
+        def scan(buf, limit):
+            scratch = getattr(local, "scratch", None)
+            if scratch is None:
+                scratch = local.scratch = hyperscan.Scratch(db)
+            offsets = []
+            line_end = [-1]
+
+            def on_match(_id, _start, end, _flags, _context):
+                offset = end - 1
+                # Keep one offset per line so limit counts lines, not raw hits
+                if offset <= line_end[0]:
+                    return False
+                offsets.append(offset)
+                newline = buf.find(b"\n", offset)
+                line_end[0] = len(buf) if newline == -1 else newline
+                # Returning True stops the scan
+                return len(offsets) >= limit
+
+            db.scan(buf, match_event_handler=on_match, scratch=scratch)
+            return offsets
+
+        return scan
+
+    if re2 is not None:
+        regex = re2.compile((b"(?im)" if ignore_case else b"(?m)") + pattern.encode('utf-8'))
+
+        return lambda buf, limit: (m.start() for m in regex.finditer(buf))
+
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    regex = re.compile(pattern.encode('utf-8'), flags)
+    return lambda buf, limit: (m.start() for m in regex.finditer(buf))
+
+
+@functools.lru_cache(maxsize=128)
+def _get_matcher(pattern: str, ignore_case: bool = True):
+    """Return the cached matcher for (pattern, flags), compiling it on first use."""
+    return _build_matcher(pattern, ignore_case)
+
+
+def _scan_file(path: str, matcher, limit: int) -> list:
+    """Return (line_no, line) for up to limit lines of path containing a match.
+
+    Binary files yield a single (0, None) entry, like grep's "Binary file matches".
+    """
+    try:
+        # One unbuffered read sized from fstat; a mapping would SIGBUS if the
+        # note is truncated mid-scan (Obsidian saves by truncate-and-rewrite)
+        with open(path, 'rb', buffering=0) as f:
+            buf = f.read()
+        hits = []
+        line_no = 1
+        pos = 0
+        line_end = -1
+        for offset in matcher(buf, limit):
+            # Several matches on one line only report the line once
+            if offset <= line_end:
+                continue
+            if not hits and buf.find(b"\0", 0, 8192) != -1:
+                return [(0, None)]
+            # Line numbers are counted lazily, only up to each match
+            line_no += buf.count(b"\n", pos, offset)
+            line_start = buf.rfind(b"\n", 0, offset) + 1
+            line_end = buf.find(b"\n", offset)
+            if line_end == -1:
+                line_end = len(buf)
+            hits.append((line_no, buf[line_start:line_end].decode('utf-8', 'replace')))
+            if len(hits) >= limit:
+                break
+            pos = offset
+        return hits
+    except (OSError, ValueError):
+        return []
+
+
+# ========================================
+# SHELL HELPERS
+# ========================================
+
+class _PersistentShell:
+    """A long-lived /bin/sh that runs one command at a time over its stdin.
+
+    Commands share the shell's process, so exported variables and other shell
+    state leak between calls; the shell is restarted if a command exits it.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def run(self, command: str, cwd: str, timeout: float):
+        """Run command in cwd and return (stdout, stderr).
+
+        Raises subprocess.TimeoutExpired (after killing the shell) on timeout.
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    ["/bin/sh"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE
+                )
+
+            # eval keeps quoting mistakes in command from swallowing the markers
+            marker = f"__END_{uuid.uuid4().hex}__"
+            script = (
+                f"cd {shlex.quote(cwd)} && eval {shlex.quote(command)} </dev/null\n"
+                f"printf '\\n%s\\n' {marker}\n"
+                f"printf '\\n%s\\n' {marker} >&2\n"
+            )
+            try:
+                self._proc.stdin.write(script.encode('utf-8'))
+                self._proc.stdin.flush()
+            except BrokenPipeError:
+                pass
+
+            end = f"\n{marker}\n".encode('utf-8')
+            out_fd, err_fd = self._proc.stdout.fileno(), self._proc.stderr.fileno()
+            streams = {out_fd: bytearray(), err_fd: bytearray()}
+            pending = set(streams)
+            exited = False
+            deadline = time.monotonic() + timeout
+
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._proc.kill()
+                    self._proc.wait()
+                    self._proc = None
+                    raise subprocess.TimeoutExpired(command, timeout)
+
+                ready, _, _ = select.select(list(pending), [], [], remaining)
+                for fd in ready:
+                    chunk = os.read(fd, 65536)
+                    buf = streams[fd]
+                    if not chunk:
+                        # The shell exited (e.g. "exit" or a syntax error)
+                        exited = True
+                        pending.discard(fd)
+                        continue
+                    buf += chunk
+                    if buf.endswith(end):
+                        del buf[-len(end):]
+                        pending.discard(fd)
+
+            if exited:
+                self._proc.wait()
+                self._proc = None
+
+            stdout = streams[out_fd].decode('utf-8', 'replace')
+            stderr = streams[err_fd].decode('utf-8', 'replace')
+            return stdout, stderr
+
+
 class Tools:
     def __init__(self):
         # Base directory - agents can access anything under here
@@ -19,6 +666,17 @@ class Tools:
         # Or allow full system access (use with caution)
         # self.base_path = Path("/")
 
+        # Resolved once; helpers work on str paths
+        self._base_str = str(self.base_path)
+
+        # fdatasync() each write before it replaces the old file (slower, durable)
+        self.sync_writes = False
+
+        # Run bash() commands in one long-lived shell instead of a fresh
+        # /bin/sh per call. Faster, but commands can affect each other's state.
+        self.persistent_shell = False
+        self._shell = None
+
     # ========================================
     # CORE TOOLS (matching Claude Code)
     # ========================================
@@ -33,19 +691,40 @@ class Tools:
         read("/Users/zaye/Documents/Vault/People/John.md")
         read("Vault/People/John.md")  # relative to base_path
         """
-        path = self._resolve_path(file_path)
+        path = self._resolve_str(file_path)
 
-        if not path.exists():
+        try:
+            content = _read_cached(path)
+            return content
+        except (FileNotFoundError, NotADirectoryError):
             return f"Error: File not found: {file_path}"
-
-        if not path.is_file():
+        except IsADirectoryError:
             return f"Error: Not a file: {file_path}"
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
+
+    def read_many(self, paths: List[str], __user__: dict = {}) -> str:
+        """
+        Read several files at once. Returns JSON mapping each path to its content.
+
+        :param paths: Absolute or relative paths to files
 
+        Example:
+        read_many(["Vault/People/John.md", "Vault/People/Jane Smith.md"])
+        """
         try:
-            content = path.read_text(encoding='utf-8')
-            return content
+            reader = _get_uring_reader()
+            if reader is None:
+                contents = _POOL.map(self.read, paths)
+            else:
+                resolved = [self._resolve_str(p) for p in paths]
+                contents = [
+                    self._format_read(p, data)
+                    for p, data in zip(paths, reader.read_files(resolved))
+                ]
+            return json.dumps(dict(zip(paths, contents)), indent=2)
         except Exception as e:
-            return f"Error reading file: {str(e)}"
+            return f"Error reading files: {str(e)}"
 
     def write(
         self,
@@ -62,18 +741,20 @@ class Tools:
         Example:
         write("Vault/People/New Person.md", "---\\ntype: person\\n---\\n\\n# Biography")
         """
-        path = self._resolve_path(file_path)
+        path = self._resolve_str(file_path)
 
         try:
             # Create parent directories if needed
-            path.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
 
             # Write file
-            path.write_text(content, encoding='utf-8')
+            _write_atomic(path, content.encode('utf-8'), self.sync_writes)
 
             return f"✓ Wrote to: {path}"
         except Exception as e:
             return f"Error writing file: {str(e)}"
+        finally:
+            _invalidate_cached(path)
 
     def edit(
         self,
@@ -92,26 +773,40 @@ class Tools:
         Example:
         edit("Vault/People/John.md", "status: inactive", "status: active")
         """
-        path = self._resolve_path(file_path)
-
-        if not path.exists():
-            return f"Error: File not found: {file_path}"
+        path = self._resolve_str(file_path)
 
         try:
-            content = path.read_text(encoding='utf-8')
-
-            if old_string not in content:
-                return f"Error: String not found in file: {old_string}"
-
-            # Replace
-            new_content = content.replace(old_string, new_string, 1)
-
-            # Write back
-            path.write_text(new_content, encoding='utf-8')
+            old_bytes = old_string.encode('utf-8')
+            new_bytes = new_string.encode('utf-8')
+
+            with open(path, 'r+b', buffering=0) as f:
+                # Work on a copy: a shared mapping would SIGBUS if the note
+                # is truncated while we hold it
+                data = f.read()
+                idx = data.find(old_bytes)
+                if idx == -1:
+                    return f"Error: String not found in file: {old_string}"
+
+                end = idx + len(old_bytes)
+                if len(new_bytes) == len(old_bytes):
+                    # Same length: patch only the changed span in place
+                    os.pwrite(f.fileno(), new_bytes, idx)
+                    return f"✓ Edited: {path}"
+
+                # Rewrite from the match onwards and trim any leftover bytes
+                tail = data[end:]
+                os.pwrite(f.fileno(), new_bytes + tail, idx)
+                f.truncate(idx + len(new_bytes) + len(tail))
 
             return f"✓ Edited: {path}"
+        except (FileNotFoundError, NotADirectoryError):
+            return f"Error: File not found: {file_path}"
+        except IsADirectoryError:
+            return f"Error: Not a file: {file_path}"
         except Exception as e:
             return f"Error editing file: {str(e)}"
+        finally:
+            _invalidate_cached(path)
 
     def bash(
         self,
@@ -131,23 +826,29 @@ class Tools:
         bash("grep -r 'project' Vault/Projects")
         """
         if cwd:
-            working_dir = self._resolve_path(cwd)
+            working_dir = self._resolve_str(cwd)
         else:
-            working_dir = self.base_path
+            working_dir = self._base_str
 
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=str(working_dir),
-                timeout=30
-            )
-
-            output = result.stdout
-            if result.stderr:
-                output += f"\n[stderr]: {result.stderr}"
+            if self.persistent_shell:
+                if self._shell is None:
+                    self._shell = _PersistentShell()
+                stdout, stderr = self._shell.run(command, working_dir, timeout=30)
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    cwd=working_dir,
+                    timeout=30
+                )
+                stdout, stderr = result.stdout, result.stderr
+
+            output = stdout
+            if stderr:
+                output += f"\n[stderr]: {stderr}"
 
             return output if output else "(no output)"
         except subprocess.TimeoutExpired:
@@ -173,21 +874,27 @@ class Tools:
         glob("**/2025-*.md")  # Files matching date pattern
         """
         if base_dir:
-            search_path = self._resolve_path(base_dir)
+            search_path = self._resolve_str(base_dir)
         else:
-            search_path = self.base_path
+            search_path = self._base_str
 
         try:
-            # Use pathlib for glob
-            matches = list(search_path.glob(pattern))
+            # A pattern without wildcards names one file: a single stat answers it
+            if not _has_wildcard(pattern):
+                rel = _normalize_literal(pattern)
+                if rel and os.path.isfile(os.path.join(search_path, rel)):
+                    return rel
+                return f"No files found matching: {pattern}"
 
-            # Convert to relative paths
-            results = [str(p.relative_to(search_path)) for p in matches if p.is_file()]
+            prefix_len = len(os.fsencode(os.path.join(search_path, "")))
+            results = [path[prefix_len:] for path in _iter_files(search_path, pattern)]
 
             if not results:
                 return f"No files found matching: {pattern}"
 
-            return "\n".join(sorted(results))
+            # Decode once, after sorting the raw bytes paths
+            results.sort()
+            return os.fsdecode(b"\n".join(results))
         except Exception as e:
             return f"Error searching files: {str(e)}"
 
@@ -211,29 +918,41 @@ class Tools:
         grep("TODO", file_pattern="**/*.md")
         """
         if search_path:
-            base = self._resolve_path(search_path)
+            base = self._resolve_str(search_path)
         else:
-            base = self.base_path
+            base = self._base_str
 
         try:
-            # Use grep command for speed
-            cmd = f"grep -r -n -i '{pattern}' --include='{file_pattern}' ."
-
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=str(base),
-                timeout=30
-            )
+            matcher = _get_matcher(pattern)
+
+            # Bare name patterns apply at any depth, like grep --include
+            glob_pattern = file_pattern if "/" in file_pattern else "**/" + file_pattern
+            files = list(_iter_files(base, glob_pattern))
+            prefix_len = len(os.fsencode(os.path.join(base, "")))
 
-            if result.returncode == 0:
-                return result.stdout
-            elif result.returncode == 1:
+            futures = {
+                _SCAN_POOL.submit(_scan_file, path, matcher, _GREP_MAX_MATCHES + 1): path
+                for path in files
+            }
+            results = []
+            for future in as_completed(futures):
+                rel = os.fsdecode(futures[future][prefix_len:])
+                for line_no, line in future.result():
+                    results.append((rel, line_no, line))
+
+            if not results:
                 return f"No matches found for: {pattern}"
-            else:
-                return f"Error: {result.stderr}"
+
+            results.sort()
+            output = []
+            for rel, line_no, line in results[:_GREP_MAX_MATCHES]:
+                if line is None:
+                    output.append(f"Binary file ./{rel} matches\n")
+                else:
+                    output.append(f"./{rel}:{line_no}:{line}\n")
+            if len(results) > _GREP_MAX_MATCHES:
+                output.append(f"... (showing first {_GREP_MAX_MATCHES} of {len(results)}+ matches)\n")
+            return "".join(output)
         except Exception as e:
             return f"Error searching: {str(e)}"
 
@@ -241,16 +960,42 @@ class Tools:
     # HELPER METHODS
     # ========================================
 
-    def _resolve_path(self, file_path: str) -> Path:
-        """Convert relative or absolute path to absolute Path object."""
-        path = Path(file_path)
+    def _format_read(self, file_path: str, data) -> str:
+        """Turn a batched read result (bytes or OSError) into read()'s output."""
+        if isinstance(data, (FileNotFoundError, NotADirectoryError)):
+            return f"Error: File not found: {file_path}"
+        if isinstance(data, IsADirectoryError):
+            return f"Error: Not a file: {file_path}"
+        if isinstance(data, OSError):
+            return f"Error reading file: {str(data)}"
+        try:
+            return data.decode('utf-8')
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
+
+    def _stat_info(self, file_path: str):
+        """Return file_info's fields for one path, or an error string."""
+        path = self._resolve_str(file_path)
 
-        # If absolute, return as-is
-        if path.is_absolute():
-            return path
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return f"Error: File not found: {file_path}"
+        except (OSError, ValueError) as e:
+            # Reported per path so one bad entry does not fail file_info_many
+            return f"Error getting file info: {str(e)}"
+
+        return {
+            "path": path,
+            "size": f"{st.st_size:,} bytes",
+            "modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st.st_mtime)),
+            "is_file": stat.S_ISREG(st.st_mode),
+            "is_dir": stat.S_ISDIR(st.st_mode)
+        }
 
-        # If relative, resolve from base_path
-        return self.base_path / path
+    def _resolve_str(self, file_path: str) -> str:
+        """Convert relative or absolute path to an absolute path string."""
+        return _resolve(self._base_str, file_path)
 
     # ========================================
     # ADDITIONAL UTILITIES
@@ -267,21 +1012,25 @@ class Tools:
         :param dir_path: Directory to list (default: base_path)
         """
         if dir_path:
-            path = self._resolve_path(dir_path)
+            path = self._resolve_str(dir_path)
         else:
-            path = self.base_path
+            path = self._base_str
 
-        if not path.exists():
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
             return f"Error: Directory not found: {dir_path}"
 
-        if not path.is_dir():
+        if not stat.S_ISDIR(mode):
             return f"Error: Not a directory: {dir_path}"
 
         try:
-            items = []
-            for item in sorted(path.iterdir()):
-                prefix = "[DIR]" if item.is_dir() else "[FILE]"
-                items.append(f"{prefix} {item.name}")
+            # DirEntry.is_dir() uses the type cached by scandir, no extra stat;
+            # (name, is_dir) tuples sort on the name strings without a key function
+            with os.scandir(path) as it:
+                entries = [(e.name, _entry_is_dir(e)) for e in it]
+            entries.sort()
+            items = [f"{'[DIR]' if is_dir else '[FILE]'} {name}" for name, is_dir in entries]
 
             return "\n".join(items) if items else "(empty directory)"
         except Exception as e:
@@ -297,27 +1046,30 @@ class Tools:
 
         :param file_path: Path to file
         """
-        path = self._resolve_path(file_path)
-
-        if not path.exists():
-            return f"Error: File not found: {file_path}"
-
         try:
-            stat = path.stat()
+            info = self._stat_info(file_path)
+            if isinstance(info, str):
+                return info
+            return json.dumps(info, indent=2)
+        except Exception as e:
+            return f"Error getting file info: {str(e)}"
 
-            from datetime import datetime
-            mtime = datetime.fromtimestamp(stat.st_mtime)
+    def file_info_many(
+        self,
+        paths: List[str],
+        __user__: dict = {}
+    ) -> str:
+        """
+        Get information about several files at once. Returns JSON keyed by path.
 
-            info = {
-                "path": str(path),
-                "size": f"{stat.st_size:,} bytes",
-                "modified": mtime.strftime("%Y-%m-%d %H:%M:%S"),
-                "is_file": path.is_file(),
-                "is_dir": path.is_dir()
-            }
+        :param paths: Paths to files
 
-            import json
-            return json.dumps(info, indent=2)
+        Example:
+        file_info_many(["Vault/People/John.md", "Vault/People/Jane Smith.md"])
+        """
+        try:
+            infos = _POOL.map(self._stat_info, paths)
+            return json.dumps(dict(zip(paths, infos)), indent=2)
         except Exception as e:
             return f"Error getting file info: {str(e)}"
 
@@ -331,10 +1083,10 @@ class Tools:
 
         :param dir_path: Directory path to create
         """
-        path = self._resolve_path(dir_path)
+        path = self._resolve_str(dir_path)
 
         try:
-            path.mkdir(parents=True, exist_ok=True)
+            os.makedirs(path, exist_ok=True)
             return f"✓ Created directory: {path}"
         except Exception as e:
             return f"Error creating directory: {str(e)}"
@@ -349,19 +1101,22 @@ class Tools:
 
         :param file_path: Path to file to delete
         """
-        path = self._resolve_path(file_path)
-
-        if not path.exists():
-            return f"Error: File not found: {file_path}"
+        path = self._resolve_str(file_path)
 
         try:
-            if path.is_file():
-                path.unlink()
-                return f"✓ Deleted file: {path}"
-            else:
+            os.unlink(path)
+            return f"✓ Deleted file: {path}"
+        except (FileNotFoundError, NotADirectoryError):
+            return f"Error: File not found: {file_path}"
+        except (IsADirectoryError, PermissionError) as e:
+            # macOS reports EPERM rather than EISDIR when unlinking a directory
+            if isinstance(e, IsADirectoryError) or os.path.isdir(path):
                 return f"Error: Not a file (use rmdir for directories): {file_path}"
+            return f"Error deleting file: {str(e)}"
         except Exception as e:
             return f"Error deleting file: {str(e)}"
+        finally:
+            _invalidate_cached(path)
 
     def append(
         self,
@@ -375,18 +1130,20 @@ class Tools:
         :param file_path: Path to file
         :param content: Content to append
         """
-        path = self._resolve_path(file_path)
+        path = self._resolve_str(file_path)
 
-        if not path.exists():
+        if not os.path.exists(path):
             return f"Error: File not found: {file_path}"
 
         try:
-            with open(path, 'a', encoding='utf-8') as f:
-                f.write(content)
+            with open(path, 'ab', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(content.encode('utf-8'))
 
             return f"✓ Appended to: {path}"
         except Exception as e:
             return f"Error appending to file: {str(e)}"
+        finally:
+            _invalidate_cached(path)
 
 
 # ========================================